@@ -48,6 +48,8 @@ class RandomElasticDeformationLayer(RandomisedLayer):
             name='random_elastic_deformation')
 
         self._bspline_transformation = None
+        self._bspline_shape = None
+        self._bspline_init_params = None
         self.num_controlpoints = max(num_controlpoints, 2)
         self.std_deformation_sigma = max(std_deformation_sigma, 1)
         self.proportion_to_augment = proportion_to_augment
@@ -72,17 +74,21 @@ class RandomElasticDeformationLayer(RandomisedLayer):
         if len(shape) == 5:  # for niftynet reader outputs
             squeezed_shape = [dim for dim in shape[:3] if dim > 1]
         else:
-            squeezed_shape = shape[:self.spatial_rank]
-        itkimg = sitk.GetImageFromArray(np.zeros(squeezed_shape))
-        trans_from_domain_mesh_size = \
-            [self.num_controlpoints] * itkimg.GetDimension()
-        self._bspline_transformation = sitk.BSplineTransformInitializer(
-            itkimg, trans_from_domain_mesh_size)
-
-        params = self._bspline_transformation.GetParameters()
-        params_numpy = np.asarray(params, dtype=float)
-        params_numpy = params_numpy + np.random.randn(
-            params_numpy.shape[0]) * self.std_deformation_sigma
+            squeezed_shape = list(shape[:self.spatial_rank])
+        if squeezed_shape != self._bspline_shape:
+            # the control point grid only depends on the image shape,
+            # initialise it once and only redraw the displacements
+            itkimg = sitk.GetImageFromArray(np.zeros(squeezed_shape))
+            trans_from_domain_mesh_size = \
+                [self.num_controlpoints] * itkimg.GetDimension()
+            self._bspline_transformation = sitk.BSplineTransformInitializer(
+                itkimg, trans_from_domain_mesh_size)
+            self._bspline_init_params = np.asarray(
+                self._bspline_transformation.GetParameters(), dtype=float)
+            self._bspline_shape = squeezed_shape
+
+        params_numpy = self._bspline_init_params + np.random.randn(
+            self._bspline_init_params.shape[0]) * self.std_deformation_sigma
 
         # remove z deformations! The resolution in z is too bad
         # params_numpy[0:int(len(params) / 3)] = 0
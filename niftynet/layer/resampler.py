@@ -468,7 +468,7 @@ try: # Some tf versions have this defined already
     @tf.RegisterGradient('FloorMod')
     def _floormod_grad(op, grad):
         return [None, None]
-except:
+except KeyError:
     pass
 
 SUPPORTED_INTERPOLATION = {'BSPLINE', 'LINEAR', 'NEAREST', 'IDW'}
@@ -41,7 +41,7 @@ def get_niftynet_version():
                 version_string = '{} ({})'.format(
                     version_info['full-revisionid'], version_info['error']
                 )
-    except:
+    except Exception:  # pylint: disable=broad-except
         pass  # version_string is None by default
 
     # If we cannot get a git version, attempt to get a package version
@@ -49,7 +49,7 @@ def get_niftynet_version():
         try:
             import pkg_resources
             version_string = pkg_resources.get_distribution("niftynet").version
-        except:
+        except Exception:  # pylint: disable=broad-except
             pass  # version_string is None by default
 
     return version_string
@@ -94,6 +94,43 @@ class RandDeformationTests(tf.test.TestCase):
             with self.test_session():
                 self.assertFalse(np.array_equal(out['testdata'], x_old))
 
+    def test_transformation_reused_for_same_shape(self):
+        rand_deformation_layer = RandomElasticDeformationLayer(num_controlpoints=4,
+                                                               std_deformation_sigma=1,
+                                                               proportion_to_augment=1.)
+        x, _ = self.get_5d_input()
+        rand_deformation_layer.randomise(x)
+        transformation = rand_deformation_layer._bspline_transformation
+        params = transformation.GetParameters()
+        rand_deformation_layer.randomise(x)
+        self.assertIs(rand_deformation_layer._bspline_transformation,
+                      transformation)
+        self.assertNotEqual(transformation.GetParameters(), params)
+
+    def test_transformation_rebuilt_for_new_shape(self):
+        rand_deformation_layer = RandomElasticDeformationLayer(num_controlpoints=4,
+                                                               std_deformation_sigma=1,
+                                                               proportion_to_augment=1.,
+                                                               spatial_rank=3)
+        x, _ = self.get_5d_input()
+        rand_deformation_layer.randomise(x)
+        transformation = rand_deformation_layer._bspline_transformation
+
+        x, interp_orders = self.get_4d_input()
+        rand_deformation_layer.randomise(x)
+        new_transformation = rand_deformation_layer._bspline_transformation
+        self.assertIsNot(new_transformation, transformation)
+
+        expected = sitk.BSplineTransformInitializer(
+            sitk.GetImageFromArray(np.zeros(SHAPE_4D[:3])), [4] * 3)
+        self.assertEqual(len(new_transformation.GetParameters()),
+                         len(expected.GetParameters()))
+        self.assertEqual(new_transformation.GetFixedParameters(),
+                         expected.GetFixedParameters())
+
+        out = rand_deformation_layer(x, interp_orders)
+        self.assertEqual(out['testdata'].shape, SHAPE_4D)
+
 
 if __name__ == "__main__":
     tf.test.main()